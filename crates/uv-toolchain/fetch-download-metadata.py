@@ -21,6 +21,7 @@ import logging
 import re
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 from pathlib import Path
 from urllib.parse import unquote
@@ -31,6 +32,8 @@ HEADERS = {
     "X-GitHub-Api-Version": "2022-11-28",
 }
 VERSIONS_FILE = SELF_DIR / "download-metadata.json"
+# The number of checksum files to fetch concurrently
+SHA256_CONCURRENCY = 16
 FLAVOR_PREFERENCES = [
     "shared-pgo",
     "shared-noopt",
@@ -235,7 +238,6 @@ def find():
                 libc,
             )
             logging.info("Found %s", key)
-            sha256 = read_sha256(url)
 
             final_results[key] = {
                 "name": interpreter,
@@ -246,9 +248,18 @@ def find():
                 "minor": py_ver[1],
                 "patch": py_ver[2],
                 "url": url,
-                "sha256": sha256,
+                "sha256": None,
             }
 
+    # Each checksum is a separate request, so fetch them concurrently
+    logging.info("Fetching checksums for %d downloads...", len(final_results))
+    with ThreadPoolExecutor(max_workers=SHA256_CONCURRENCY) as executor:
+        checksums = executor.map(
+            read_sha256, [entry["url"] for entry in final_results.values()]
+        )
+        for entry, checksum in zip(final_results.values(), checksums):
+            entry["sha256"] = checksum
+
     VERSIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
     VERSIONS_FILE.write_text(json.dumps(final_results, indent=2))
 